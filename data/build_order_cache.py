@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Order sheet 캐시 생성 스크립트
+../user_study_comparisons/*/order_sheet.txt를 한 번만 파싱해서 order_cache.pkl로 저장합니다.
+각 세트는 order sheet의 mtime과 함께 저장되어, 파일이 수정되면 get_order_mappings가 자동으로 다시 파싱합니다.
+비디오 키는 order sheet에 적힌 파일 이름 그대로이며, _comparison.mp4 파일 이름으로의 변환은 사용하는 쪽에서 합니다.
+"""
+
+import glob
+import os
+import pickle
+
+ORDER_SHEETS_DIR = "../user_study_comparisons"
+ORDER_CACHE_FILE = "order_cache.pkl"
+
+# 캐시 pickle 형식 버전 - mapping 형식이 바뀌면 올려서 예전 캐시를 재생성하게 함
+# (1: {'A': .., 'B': ..} dict, 2: (model_a, model_b) 튜플, 3: 세트별 (mtime, mapping),
+#  4: order sheet에 적힌 파일 이름을 그대로 키로 사용)
+ORDER_CACHE_VERSION = 4
+
+def _read_order_sheet(order_file):
+    """Order sheet 파일 파싱 - {order sheet의 파일 이름: (Model A, Model B)} (파일이 없으면 빈 dict, 그 외 오류는 그대로 발생)"""
+    order_mapping = {}
+    try:
+        with open(order_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if ':' in line and 'Model A' in line and 'Model B' in line:
+                    parts = line.split(':')
+                    if len(parts) >= 2:
+                        filename = parts[0].strip()
+                        rest = parts[1].strip()
+                        
+                        if 'Model A' in rest and 'Model B' in rest:
+                            model_parts = rest.split(',')
+                            model_a = None
+                            model_b = None
+                            
+                            for part in model_parts:
+                                part = part.strip()
+                                if 'Model A' in part:
+                                    model_a = part.split('=')[1].strip()
+                                elif 'Model B' in part:
+                                    model_b = part.split('=')[1].strip()
+                            
+                            if model_a and model_b:
+                                order_mapping[filename] = (model_a, model_b)
+    except FileNotFoundError:
+        pass  # order sheet가 없는 비교 세트는 빈 mapping으로 처리
+    return order_mapping
+
+def parse_order_sheet(order_file):
+    """Order sheet 파일 파싱 - {order sheet의 파일 이름: (Model A, Model B)} (오류 시 경고 후 빈 dict)"""
+    try:
+        return _read_order_sheet(order_file)
+    except Exception as e:
+        print(f"⚠️ Error parsing order sheet {order_file}: {e}")
+        return {}
+
+def _order_sheet_mtime(order_file):
+    """order sheet 수정 시각 (파일이 없으면 None)"""
+    try:
+        return os.path.getmtime(order_file)
+    except FileNotFoundError:
+        return None
+
+def save_order_cache(order_cache, cache_file=ORDER_CACHE_FILE):
+    """캐시를 임시 파일에 쓴 뒤 교체 (중단되어도 깨진 캐시가 남지 않도록)"""
+    payload = {'version': ORDER_CACHE_VERSION, 'order_cache': order_cache}
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+
+def build_order_cache(base_path=ORDER_SHEETS_DIR, cache_file=ORDER_CACHE_FILE):
+    """모든 order sheet를 파싱해서 {comparison_set: (mtime, order_mapping)} 형태로 저장"""
+    order_cache = {}
+    for order_file in sorted(glob.glob(f"{base_path}/*/order_sheet.txt")):
+        comparison_set = os.path.basename(os.path.dirname(order_file))
+        mtime = _order_sheet_mtime(order_file)
+        try:
+            order_cache[comparison_set] = (mtime, _read_order_sheet(order_file))
+        except Exception as e:
+            # 읽기 오류는 캐시하지 않음 (다음 실행에서 다시 파싱)
+            print(f"⚠️ Error parsing order sheet {order_file}: {e}")
+    
+    save_order_cache(order_cache, cache_file)
+    return order_cache
+
+def load_order_cache(cache_file=ORDER_CACHE_FILE, base_path=ORDER_SHEETS_DIR):
+    """저장된 order sheet 캐시 로드 (캐시 파일이 없으면 빈 dict, 형식 버전이 다르면 재생성)"""
+    try:
+        with open(cache_file, 'rb') as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    
+    if not isinstance(payload, dict) or payload.get('version') != ORDER_CACHE_VERSION:
+        print(f"⚠️ {cache_file} 형식이 예전 버전이라 다시 생성합니다.")
+        return build_order_cache(base_path, cache_file)
+    return payload['order_cache']
+
+def get_order_mappings(comparison_sets, order_cache, base_path=ORDER_SHEETS_DIR, cache_file=ORDER_CACHE_FILE):
+    """비교 세트별 order mapping 반환 - {comparison_set: {order sheet의 파일 이름: (Model A, Model B)}}
+    
+    캐시에 없거나 order sheet의 mtime이 캐시와 다른 세트만 다시 파싱하고,
+    바뀐 내용이 있으면 마지막에 캐시 파일을 한 번만 갱신. 읽기 오류가 난 세트는 캐시하지 않음.
+    """
+    order_mappings = {}
+    updated = False
+    for comparison_set in comparison_sets:
+        order_file = f"{base_path}/{comparison_set}/order_sheet.txt"
+        mtime = _order_sheet_mtime(order_file)
+        cached = order_cache.get(comparison_set)
+        if cached is not None and cached[0] == mtime:
+            order_mappings[comparison_set] = cached[1]
+            continue
+        
+        try:
+            order_mapping = _read_order_sheet(order_file)
+        except Exception as e:
+            print(f"⚠️ Error parsing order sheet {order_file}: {e}")
+            order_mappings[comparison_set] = {}
+            continue
+        order_cache[comparison_set] = (mtime, order_mapping)
+        order_mappings[comparison_set] = order_mapping
+        updated = True
+    
+    if updated:
+        save_order_cache(order_cache, cache_file)
+    return order_mappings
+
+if __name__ == "__main__":
+    order_cache = build_order_cache()
+    print(f"✅ {len(order_cache)}개 비교 세트의 order sheet를 {ORDER_CACHE_FILE}에 저장했습니다.")
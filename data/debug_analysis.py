@@ -3,58 +3,33 @@
 사용자 연구 결과 간단 분석 스크립트
 """
 
-import json
 import os
+import sys
+import numpy as np
+import pandas as pd
 from collections import defaultdict
-
-def parse_order_sheet(order_file):
-    """Order sheet 파일 파싱"""
-    order_mapping = {}
-    try:
-        with open(order_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if ':' in line and 'Model A' in line and 'Model B' in line:
-                    parts = line.split(':')
-                    if len(parts) >= 2:
-                        filename = parts[0].strip()
-                        rest = parts[1].strip()
-                        
-                        if 'Model A' in rest and 'Model B' in rest:
-                            model_parts = rest.split(',')
-                            model_a = None
-                            model_b = None
-                            
-                            for part in model_parts:
-                                part = part.strip()
-                                if 'Model A' in part:
-                                    model_a = part.split('=')[1].strip()
-                                elif 'Model B' in part:
-                                    model_b = part.split('=')[1].strip()
-                            
-                            if model_a and model_b:
-                                order_mapping[filename + '_comparison.mp4'] = {
-                                    'A': model_a,
-                                    'B': model_b
-                                }
-    except Exception as e:
-        print(f"⚠️ Error parsing order sheet {order_file}: {e}")
-    return order_mapping
+from build_order_cache import load_order_cache, get_order_mappings
+from study_results import load_results, flatten_results
 
 def analyze_simple():
     # 결과 로드
     result_files = [f for f in os.listdir('.') if f.startswith('collected_results_fixed_') and f.endswith('.json')]
     latest_file = sorted(result_files)[-1]
     
-    with open(latest_file, 'r', encoding='utf-8') as f:
-        results = json.load(f)
+    results = load_results(latest_file)
     
     print(f"📊 참가자 수: {len(results)}")
     
+    # Order sheet 캐시 (build_order_cache.py로 생성, 없거나 수정된 세트는 다시 파싱해서 갱신)
+    # 예시 세트와 첫 번째 참가자의 세트를 한 번에 조회해 캐시 파일은 최대 한 번만 기록
+    order_cache = load_order_cache()
+    example_set = "matrix_vs_cogvideox_5b"
+    first_responses = results[0].get('responses', {}) if results else {}
+    order_mappings = get_order_mappings(dict.fromkeys([example_set, *first_responses]), order_cache)
+    
     # Order sheet 하나 테스트
-    order_file = "../user_study_comparisons/matrix_vs_cogvideox_5b/order_sheet.txt"
-    if os.path.exists(order_file):
-        order_mapping = parse_order_sheet(order_file)
+    order_mapping = order_mappings[example_set]
+    if order_mapping:
         print(f"📋 Order mapping 예시: {order_mapping}")
     
     # 첫 번째 참가자 데이터 분석
@@ -65,31 +40,66 @@ def analyze_simple():
         responses = first_participant.get('responses', {})
         print(f"📝 응답한 비교 세트 수: {len(responses)}")
         
+        # 비교 세트별 첫 번째 비디오 정보 (출력용)
+        summaries = []
         for comparison_set, videos in responses.items():
-            print(f"\n🎬 {comparison_set}:")
-            print(f"   비디오 수: {len(videos)}")
-            
-            # 첫 번째 비디오 분석
+            first_video = None
+            answers = None
             if videos:
-                first_video = list(videos.keys())[0]
-                first_response = videos[first_video]
-                print(f"   첫 번째 비디오: {first_video}")
+                first_video = next(iter(videos))
+                answers = videos[first_video].get('answers')
+            summaries.append((comparison_set, len(videos), first_video, answers))
+        
+        # 응답을 (set, video, question, choice) 행으로 평탄화한 뒤 세트별 첫 번째 비디오만 사용
+        # (answers가 빈 비디오는 평탄화에서 빠지므로 summaries와 같은 비디오를 명시적으로 선택)
+        first_videos = pd.DataFrame([(comparison_set, first_video)
+                                     for comparison_set, _, first_video, _ in summaries
+                                     if first_video is not None],
+                                    columns=['set', 'video'])
+        df = flatten_results([first_participant])
+        df = df.merge(first_videos, on=['set', 'video'])
+        
+        mapping_rows = []
+        for comparison_set in df['set'].unique():
+            order_mapping = order_mappings[comparison_set]
+            mapping_rows.extend((comparison_set, filename + '_comparison.mp4', model_a, model_b)
+                                for filename, (model_a, model_b) in order_mapping.items())
+        
+        # Order mapping과 한 번에 결합
+        mapping_df = pd.DataFrame(mapping_rows, columns=['set', 'video', 'A', 'B'])
+        merged = df.merge(mapping_df, on=['set', 'video'])
+        # A/B가 아닌 응답은 모델을 정하지 않고 출력에서 경고로 보고
+        merged['valid'] = merged['choice'].isin(('A', 'B'))
+        merged['model'] = np.where(merged['choice'] == 'A', merged['A'], merged['B'])
+        resolved = dict(tuple(merged.groupby('set', sort=False, observed=True)))
+        
+        # 출력은 모아서 한 번에 기록
+        out = []
+        for comparison_set, video_count, first_video, answers in summaries:
+            out.append(f"\n🎬 {comparison_set}:")
+            out.append(f"   비디오 수: {video_count}")
+            
+            if first_video is None:
+                continue
+            out.append(f"   첫 번째 비디오: {first_video}")
+            
+            if answers is None:
+                continue
+            out.append(f"   답변: {answers}")
+            
+            group = resolved.get(comparison_set)
+            if group is not None:
+                first_row = group.iloc[0]
+                out.append(f"   Order mapping: {{'A': {first_row['A']!r}, 'B': {first_row['B']!r}}}")
                 
-                if 'answers' in first_response:
-                    answers = first_response['answers']
-                    print(f"   답변: {answers}")
-                    
-                    # Order mapping과 결합
-                    if os.path.exists(f"../user_study_comparisons/{comparison_set}/order_sheet.txt"):
-                        order_mapping = parse_order_sheet(f"../user_study_comparisons/{comparison_set}/order_sheet.txt")
-                        
-                        if first_video in order_mapping:
-                            mapping = order_mapping[first_video]
-                            print(f"   Order mapping: {mapping}")
-                            
-                            for question, choice in answers.items():
-                                chosen_model = mapping.get(choice, f"Unknown-{choice}")
-                                print(f"   {question}: {choice} → {chosen_model}")
+                for question, choice, chosen_model, valid in zip(group['question'], group['choice'],
+                                                                 group['model'], group['valid']):
+                    if valid:
+                        out.append(f"   {question}: {choice} → {chosen_model}")
+                    else:
+                        out.append(f"   ⚠️ {question}: 알 수 없는 선택 {choice!r}")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     analyze_simple()
\ No newline at end of file
@@ -4,10 +4,15 @@ Example usage of the user study results aggregation script
 """
 
 from aggregate_results import UserStudyAggregator
+import argparse
 import os
 
-def create_sample_data():
-    """Create sample user responses for testing"""
+def create_sample_data(write_files=False):
+    """Create sample user responses for testing
+
+    The responses are returned in memory; they are only written to
+    sample_responses/ when write_files is True.
+    """
 
     # Sample responses from 3 users
     sample_responses = [
@@ -22,10 +27,11 @@ def create_sample_data():
     ]
 
     # Save sample data
-    os.makedirs('sample_responses', exist_ok=True)
-    for i, response in enumerate(sample_responses):
-        with open(f'sample_responses/user_{i+1}.txt', 'w') as f:
-            f.write(response)
+    if write_files:
+        os.makedirs('sample_responses', exist_ok=True)
+        for i, response in enumerate(sample_responses):
+            with open(f'sample_responses/user_{i+1}.txt', 'w') as f:
+                f.write(response)
 
     return sample_responses
 
@@ -53,15 +59,12 @@ def example_single_result():
 
     print()
 
-def example_multiple_users():
+def example_multiple_users(sample_responses):
     """Example: Process multiple users and generate analysis"""
     print("="*60)
     print("EXAMPLE 2: Multiple User Analysis")
     print("="*60)
 
-    # Create sample data
-    sample_responses = create_sample_data()
-
     aggregator = UserStudyAggregator()
     all_responses = []
 
@@ -110,11 +113,18 @@ def example_command_line():
     print("   python aggregate_results.py --results_dir responses/ --csv --output_dir analysis/")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='User study aggregation examples')
+    parser.add_argument('--write-samples', action='store_true',
+                        help='Also write the sample responses to sample_responses/')
+    args = parser.parse_args()
+
     print("USER STUDY RESULTS AGGREGATION - EXAMPLES")
     print()
 
+    sample_responses = create_sample_data(write_files=args.write_samples)
+
     example_single_result()
-    example_multiple_users()
+    example_multiple_users(sample_responses)
     example_command_line()
 
     print("\\n" + "="*60)
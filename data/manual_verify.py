@@ -3,25 +3,42 @@
 전체 통계 수동 검증
 """
 
-import json
-from collections import defaultdict
+import numpy as np
+import pandas as pd
+from study_results import load_results, flatten_results
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson 미설치 시 전체 로드로 대체
+    simdjson = None
+
+# 여러 파일을 읽을 때 내부 버퍼를 재사용하도록 파서는 하나만 생성
+_parser = simdjson.Parser() if simdjson is not None else None
+
+def load_first_responses(path, comparison_sets):
+    """첫 번째 참가자의 응답 중 필요한 비교 세트만 로드"""
+    if _parser is not None:
+        responses = _parser.load(path).at_pointer('/0/responses')
+        # 필요한 세트만 dict로 변환 (나머지는 파싱된 상태로 두고 건너뜀)
+        return {
+            comparison_set: responses[comparison_set].as_dict()
+            for comparison_set in responses.keys()
+            if comparison_set in comparison_sets
+        }
+    return load_results(path)[0]['responses']
 
 def manual_count():
     """전체 통계를 수동으로 다시 계산"""
     
-    # 결과 로드
-    with open('../collected_results_fixed_20250922_144811.json', 'r') as f:
-        results = json.load(f)
-    
-    # Order sheet 정보 (수동 입력으로 검증)
+    # Order sheet 정보 (수동 입력으로 검증) - (Model A, Model B)
     order_mappings = {
         'matrix_vs_cogvideox_5b': {
-            'sampled_053_comparison.mp4': {'A': 'matrix', 'B': 'cogvideox_5b'},
-            'generated_038_comparison.mp4': {'A': 'matrix', 'B': 'cogvideox_5b'},
+            'sampled_053_comparison.mp4': ('matrix', 'cogvideox_5b'),
+            'generated_038_comparison.mp4': ('matrix', 'cogvideox_5b'),
         },
         'matrix_vs_opensora': {
-            'sampled_053_comparison.mp4': {'A': 'matrix', 'B': 'opensora'},
-            'easy_v2_004_comparison.mp4': {'A': 'opensora', 'B': 'matrix'},
+            'sampled_053_comparison.mp4': ('matrix', 'opensora'),
+            'easy_v2_004_comparison.mp4': ('opensora', 'matrix'),
         }
         # 더 많지만 샘플만 확인
     }
@@ -29,35 +46,46 @@ def manual_count():
     print("🔢 수동 카운팅 (샘플 데이터):")
     print("="*50)
     
-    model_wins = defaultdict(int)
-    model_total = defaultdict(int)
-    
     # 첫 번째 참가자의 overall_quality만 확인
-    participant = results[0]
-    responses = participant['responses']
+    responses = load_first_responses('../collected_results_fixed_20250922_144811.json',
+                                     order_mappings)
+    df = flatten_results([{'responses': responses}])
+    df = df[df['question'] == 'overall_quality']
+    
+    mapping_df = pd.DataFrame(
+        [(comparison_set, video_file, model_a, model_b)
+         for comparison_set, videos in order_mappings.items()
+         for video_file, (model_a, model_b) in videos.items()],
+        columns=['set', 'video', 'A', 'B']
+    )
+    df = df.merge(mapping_df, on=['set', 'video'])
+    
+    # A/B가 아닌 응답은 어느 모델의 승리로도 세지 않도록 보고 후 제외
+    valid = df['choice'].isin(('A', 'B'))
+    for comparison_set, video_file, choice in zip(df['set'][~valid], df['video'][~valid], df['choice'][~valid]):
+        print(f"⚠️ {comparison_set}/{video_file}: 알 수 없는 선택 {choice!r} - 집계에서 제외")
+    df = df[valid]
+    is_a = (df['choice'] == 'A').to_numpy()
+    df['chosen_model'] = np.where(is_a, df['A'], df['B'])
+    df['other_model'] = np.where(is_a, df['B'], df['A'])
+    
+    for comparison_set, group in df.groupby('set', sort=False, observed=True):
+        print(f"\n📊 {comparison_set}:")
+        for video_file, choice, chosen_model in zip(group['video'], group['choice'], group['chosen_model']):
+            print(f"  {video_file}: 선택={choice} → {chosen_model}")
     
-    for comparison_set, videos in responses.items():
-        if comparison_set in order_mappings:
-            print(f"\n📊 {comparison_set}:")
-            for video_file, response_data in videos.items():
-                if video_file in order_mappings[comparison_set]:
-                    choice = response_data['answers']['overall_quality']
-                    mapping = order_mappings[comparison_set][video_file]
-                    
-                    chosen_model = mapping[choice]
-                    other_model = mapping['B'] if choice == 'A' else mapping['A']
-                    
-                    print(f"  {video_file}: 선택={choice} → {chosen_model}")
-                    
-                    model_wins[chosen_model] += 1
-                    model_total[chosen_model] += 1
-                    model_total[other_model] += 1
+    # 비교마다 두 모델을 (model, choice_model) 행으로 만들어 groupby로 한 번에 집계
+    pairs = pd.concat([
+        pd.DataFrame({'model': df['chosen_model'], 'choice_model': df['chosen_model']}),
+        pd.DataFrame({'model': df['other_model'], 'choice_model': df['chosen_model']}),
+    ], ignore_index=True)
+    pairs['win'] = pairs['choice_model'] == pairs['model']
+    stats = pairs.groupby('model')['win'].agg(wins='sum', total='count')
+    stats['rate'] = stats['wins'] / stats['total']
     
     print(f"\n🏆 Overall Quality 결과 (1명, 4개 비디오):")
-    for model in sorted(model_total.keys()):
-        if model_total[model] > 0:
-            win_rate = model_wins[model] / model_total[model]
-            print(f"  {model}: {win_rate:.3f} ({model_wins[model]}/{model_total[model]})")
+    for model, wins, total, win_rate in stats.itertuples():
+        print(f"  {model}: {win_rate:.3f} ({wins}/{total})")
     
     print(f"\n📈 예상 전체 결과 (3명×4개 = 12개 케이스에서):")
     print(f"matrix가 이런 패턴이라면:")
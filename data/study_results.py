@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+수집된 사용자 연구 결과 로드/평탄화 공용 모듈
+"""
+
+import json
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json으로 대체
+    orjson = None
+
+RESPONSE_COLUMNS = ['participant', 'set', 'video', 'question', 'choice']
+
+def load_results(path):
+    """결과 JSON 로드 (orjson 사용 가능 시 바이트로 읽어 바로 파싱)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def flatten_results(results):
+    """참가자별 중첩 응답을 (participant, set, video, question, choice) 행의 DataFrame으로 변환
+
+    results[i]['responses'][set][video]['answers'][question] 구조를 한 번만 순회하고,
+    문자열 컬럼은 category dtype으로 저장해 이후 조회/집계가 정수 코드 연산이 되도록 합니다.
+    """
+    rows = []
+    for participant in results:
+        participant_id = participant.get('participantId', 'Unknown')
+        for comparison_set, videos in participant.get('responses', {}).items():
+            for video_file, response_data in videos.items():
+                answers = response_data.get('answers')
+                if not answers:
+                    continue
+                rows.extend((participant_id, comparison_set, video_file, question, choice)
+                            for question, choice in answers.items())
+    
+    df = pd.DataFrame(rows, columns=RESPONSE_COLUMNS)
+    return df.astype({column: 'category' for column in RESPONSE_COLUMNS})
@@ -3,24 +3,45 @@
 결과 검증 스크립트 - 수동으로 몇 개 케이스를 확인해봅시다
 """
 
-import json
+import sys
+from study_results import load_results
+
+try:
+    import ijson
+except ImportError:  # ijson 미설치 시 전체 로드로 대체
+    ijson = None
+
+def load_answers(path, cases):
+    """첫 번째 참가자의 (비교 세트, 비디오) 케이스별 answers만 추출"""
+    if ijson is not None:
+        # 배열의 첫 번째 원소(첫 번째 참가자)까지만 읽고 중단
+        with open(path, 'rb') as f:
+            first_participant = next(ijson.items(f, 'item'))
+    else:
+        first_participant = load_results(path)[0]
+    responses = first_participant['responses']
+    return [responses[comparison_set][video_file]['answers']
+            for comparison_set, video_file in cases]
 
 def verify_specific_cases():
     """구체적인 케이스들을 수동으로 검증"""
     
-    # 결과 파일 로드
-    with open('collected_results_fixed_20250922_144811.json', 'r') as f:
-        results = json.load(f)
+    # 결과 파일에서 확인할 케이스의 answers만 로드
+    case1, case2 = load_answers('collected_results_fixed_20250922_144811.json', [
+        ('matrix_vs_cogvideox_5b', 'sampled_053_comparison.mp4'),
+        ('matrix_vs_opensora', 'easy_v2_004_comparison.mp4'),
+    ])
     
-    print("🔍 수동 검증 - 구체적인 케이스들")
-    print("="*60)
+    # 출력은 모아서 한 번에 기록
+    out = []
+    out.append("🔍 수동 검증 - 구체적인 케이스들")
+    out.append("="*60)
     
     # Case 1: matrix_vs_cogvideox_5b / sampled_053
-    print("\n📋 Case 1: matrix_vs_cogvideox_5b / sampled_053")
-    print("Order Sheet: sampled_053.mp4: Model A = matrix, Model B = cogvideox_5b")
+    out.append("\n📋 Case 1: matrix_vs_cogvideox_5b / sampled_053")
+    out.append("Order Sheet: sampled_053.mp4: Model A = matrix, Model B = cogvideox_5b")
     
-    case1 = results[0]['responses']['matrix_vs_cogvideox_5b']['sampled_053_comparison.mp4']['answers']
-    print("사용자 응답:")
+    out.append("사용자 응답:")
     for question, choice in case1.items():
         if choice == 'A':
             selected_model = 'matrix'
@@ -28,14 +49,13 @@ def verify_specific_cases():
             selected_model = 'cogvideox_5b'
         else:
             selected_model = 'unknown'
-        print(f"  {question}: {choice} → {selected_model}")
+        out.append(f"  {question}: {choice} → {selected_model}")
     
     # Case 2: matrix_vs_opensora / easy_v2_004
-    print("\n📋 Case 2: matrix_vs_opensora / easy_v2_004")
-    print("Order Sheet: easy_v2_004.mp4: Model A = opensora, Model B = matrix")
+    out.append("\n📋 Case 2: matrix_vs_opensora / easy_v2_004")
+    out.append("Order Sheet: easy_v2_004.mp4: Model A = opensora, Model B = matrix")
     
-    case2 = results[0]['responses']['matrix_vs_opensora']['easy_v2_004_comparison.mp4']['answers']
-    print("사용자 응답:")
+    out.append("사용자 응답:")
     for question, choice in case2.items():
         if choice == 'A':
             selected_model = 'opensora'  # A가 opensora
@@ -43,18 +63,20 @@ def verify_specific_cases():
             selected_model = 'matrix'    # B가 matrix
         else:
             selected_model = 'unknown'
-        print(f"  {question}: {choice} → {selected_model}")
+        out.append(f"  {question}: {choice} → {selected_model}")
     
     # 기존 방식과 비교
-    print("\n" + "="*60)
-    print("🚨 기존 잘못된 방식이라면:")
-    print("matrix_vs_opensora에서 A=matrix, B=opensora로 잘못 가정")
-    print("→ easy_v2_004에서 A 선택 시 matrix로 잘못 카운트")
-    print("→ 실제로는 A=opensora이므로 opensora가 선택된 것!")
-    
-    print("\n✅ 올바른 방식:")
-    print("Order sheet를 정확히 읽어서 A=opensora, B=matrix")
-    print("→ A 선택 시 opensora로 정확히 카운트")
+    out.append("\n" + "="*60)
+    out.append("🚨 기존 잘못된 방식이라면:")
+    out.append("matrix_vs_opensora에서 A=matrix, B=opensora로 잘못 가정")
+    out.append("→ easy_v2_004에서 A 선택 시 matrix로 잘못 카운트")
+    out.append("→ 실제로는 A=opensora이므로 opensora가 선택된 것!")
+    
+    out.append("\n✅ 올바른 방식:")
+    out.append("Order sheet를 정확히 읽어서 A=opensora, B=matrix")
+    out.append("→ A 선택 시 opensora로 정확히 카운트")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     verify_specific_cases()
\ No newline at end of file
@@ -4,91 +4,100 @@
 """
 
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
 import numpy as np
-from collections import defaultdict
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from build_order_cache import ORDER_SHEETS_DIR, load_order_cache, get_order_mappings
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['Arial Unicode MS', 'DejaVu Sans', 'sans-serif']
-plt.rcParams['axes.unicode_minus'] = False
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json으로 대체
+    orjson = None
+
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:  # ijson C 백엔드가 없으면 전체 로드로 대체
+    ijson = None
+
+# 비교 대상 모델 (결과에 다른 모델이 있으면 분석 시 뒤에 추가됨)
+MODELS = ['matrix', 'cogvideox_5b', 'opensora', 'tavid', 'wan14b']
+
+# matplotlib/pandas는 차트를 그릴 때 _lazy_imports()로 로드
+# (order sheet 파싱만 쓰는 경우 import 비용을 내지 않도록)
+plt = None
+pd = None
+
+def _lazy_imports():
+    """차트용 무거운 모듈 로드 - Agg 백엔드와 한글 폰트 설정 포함 (여러 번 호출해도 안전)"""
+    global plt, pd
+    if plt is not None:
+        return
+    
+    import matplotlib
+    matplotlib.use('Agg')  # pyplot import 전에 지정해 GUI 백엔드 탐색 생략
+    import matplotlib.pyplot
+    import pandas
+    
+    # 한글 폰트 설정
+    matplotlib.pyplot.rcParams['font.family'] = ['Arial Unicode MS', 'DejaVu Sans', 'sans-serif']
+    matplotlib.pyplot.rcParams['axes.unicode_minus'] = False
+    
+    plt = matplotlib.pyplot
+    pd = pandas
+
+def iter_participants(filename):
+    """결과 파일(참가자 배열)에서 참가자 데이터를 하나씩 반환"""
+    if ijson is not None:
+        # 배열 원소 단위로 스트리밍 - 전체 문서를 메모리에 올리지 않음
+        with open(filename, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    elif orjson is not None:
+        with open(filename, 'rb') as f:
+            yield from orjson.loads(f.read())
+    else:
+        with open(filename, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
 
 def load_latest_results():
-    """가장 최신 결과 파일 로드"""
-    result_files = [f for f in os.listdir('.') if f.startswith('collected_results_fixed_') and f.endswith('.json')]
-    if not result_files:
+    """가장 최신 결과 파일의 참가자 이터레이터와 파일 이름 반환"""
+    # 한 번의 scandir 순회로 수정 시각이 가장 최근인 결과 파일 선택
+    with os.scandir('.') as entries:
+        latest = max((entry for entry in entries
+                      if entry.name.startswith('collected_results_fixed_') and entry.name.endswith('.json')),
+                     key=lambda entry: entry.stat().st_mtime, default=None)
+    if latest is None:
         raise FileNotFoundError("결과 파일을 찾을 수 없습니다.")
     
-    # 가장 최신 파일 선택
-    latest_file = sorted(result_files)[-1]
+    latest_file = latest.name
     print(f"📊 로딩 중: {latest_file}")
     
-    with open(latest_file, 'r', encoding='utf-8') as f:
-        return json.load(f), latest_file
-
-def parse_order_sheet(order_file):
-    """Order sheet 파일 파싱"""
-    order_mapping = {}
-    try:
-        with open(order_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if ':' in line and 'Model A' in line and 'Model B' in line:
-                    # easy_v2_017.mp4: Model A = cogvideox_5b, Model B = matrix 형식 파싱
-                    parts = line.split(':')
-                    if len(parts) >= 2:
-                        filename = parts[0].strip()
-                        rest = parts[1].strip()
-                        
-                        # Model A와 Model B 추출
-                        if 'Model A' in rest and 'Model B' in rest:
-                            model_parts = rest.split(',')
-                            model_a = None
-                            model_b = None
-                            
-                            for part in model_parts:
-                                part = part.strip()
-                                if 'Model A' in part:
-                                    model_a = part.split('=')[1].strip()
-                                elif 'Model B' in part:
-                                    model_b = part.split('=')[1].strip()
-                            
-                            if model_a and model_b:
-                                # .mp4를 _comparison.mp4로 교체
-                                comparison_filename = filename.replace('.mp4', '_comparison.mp4')
-                                order_mapping[comparison_filename] = {
-                                    'A': model_a,
-                                    'B': model_b
-                                }
-    except FileNotFoundError:
-        print(f"⚠️ Order sheet not found: {order_file}")
-    except Exception as e:
-        print(f"⚠️ Error parsing order sheet {order_file}: {e}")
-    return order_mapping
+    return iter_participants(latest_file), latest_file
 
 def load_order_sheets():
-    """모든 order sheet 로드"""
-    order_sheets = {}
-    base_path = "../user_study_comparisons"
+    """모든 order sheet 로드 - {comparison_set: {비교 비디오 파일: (Model A, Model B)}}
     
+    build_order_cache의 order_cache.pkl을 공유 (mtime이 바뀐 세트만 다시 파싱)
+    """
     comparison_folders = [
         "matrix_vs_cogvideox_5b", "matrix_vs_opensora", "matrix_vs_tavid", "matrix_vs_wan14b",
         "cogvideox_5b_vs_opensora", "cogvideox_5b_vs_tavid", "cogvideox_5b_vs_wan14b",
         "opensora_vs_tavid", "opensora_vs_wan14b", "tavid_vs_wan14b"
     ]
+    comparison_folders = [folder for folder in comparison_folders
+                          if os.path.exists(f"{ORDER_SHEETS_DIR}/{folder}/order_sheet.txt")]
     
-    for folder in comparison_folders:
-        order_file = f"{base_path}/{folder}/order_sheet.txt"
-        if os.path.exists(order_file):
-            order_sheets[folder] = parse_order_sheet(order_file)
+    order_mappings = get_order_mappings(comparison_folders, load_order_cache())
     
-    return order_sheets
+    # easy_v2_017.mp4 -> easy_v2_017_comparison.mp4
+    return {
+        folder: {filename.replace('.mp4', '_comparison.mp4'): models
+                 for filename, models in order_mapping.items()}
+        for folder, order_mapping in order_mappings.items()
+    }
 
-def analyze_results(results, order_sheets):
-    """결과 분석"""
+def analyze_results(participants, order_sheets):
+    """결과 분석 (participants는 참가자 dict의 이터러블, 한 번만 순회)"""
     questions = ['interaction_accuracy', 'entity_accuracy', 'temporal_consistency', 
                 'prompt_faithfulness', 'overall_quality']
     
@@ -100,169 +109,200 @@ def analyze_results(results, order_sheets):
         'overall_quality': '전반적 품질'
     }
     
-    model_wins = {q: defaultdict(int) for q in questions}
-    model_total = {q: defaultdict(int) for q in questions}
+    # 모델을 정수 인덱스로 매핑해 (질문 순번, 모델) 단위로 집계
+    model_index = {model: i for i, model in enumerate(MODELS)}
+    q_keys = []
+    a_keys = []
+    b_keys = []
+    choice_is_a = []
     
-    total_participants = len(results)
-    print(f"📈 분석 중: {total_participants}명의 참가자 데이터")
+    total_participants = 0
+    invalid_choices = 0
     
-    for participant in results:
+    for participant in participants:
+        total_participants += 1
         responses = participant['responses']
         
         for comparison_set, videos in responses.items():
-            if comparison_set not in order_sheets:
+            order_mapping = order_sheets.get(comparison_set)
+            if order_mapping is None:
                 continue
-                
-            order_mapping = order_sheets[comparison_set]
             
             for video_file, response_data in videos.items():
-                if video_file not in order_mapping:
+                mapping = order_mapping.get(video_file)
+                answers = response_data.get('answers')
+                if mapping is None or answers is None:
                     continue
-                    
-                mapping = order_mapping[video_file]
                 
-                for question in questions:
-                    if 'answers' in response_data and question in response_data['answers']:
-                        choice = response_data['answers'][question]
-                        chosen_model = mapping[choice]
-                        other_model = mapping['B'] if choice == 'A' else mapping['A']
-                        
-                        model_wins[question][chosen_model] += 1
-                        model_total[question][chosen_model] += 1
-                        model_total[question][other_model] += 1
-    
-    return model_wins, model_total, question_names
-
-def create_win_rate_chart(model_wins, model_total, question_names):
+                model_a, model_b = mapping
+                a_model = model_index.setdefault(model_a, len(model_index))
+                b_model = model_index.setdefault(model_b, len(model_index))
+                
+                for qi, question in enumerate(questions):
+                    choice = answers.get(question)
+                    if choice is None:
+                        continue
+                    if choice not in ('A', 'B'):
+                        # A/B가 아닌 응답은 어느 모델의 승리로도 세지 않음
+                        invalid_choices += 1
+                        continue
+                    q_keys.append(qi)
+                    a_keys.append(a_model)
+                    b_keys.append(b_model)
+                    choice_is_a.append(choice == 'A')
+    
+    # (질문, 모델) 복합 인덱스에 대해 bincount로 한 번에 카운트
+    n_questions = len(questions)
+    n_models = len(model_index)
+    q_arr = np.fromiter(q_keys, dtype=np.int64, count=len(q_keys))
+    a_arr = np.fromiter(a_keys, dtype=np.int64, count=len(a_keys))
+    b_arr = np.fromiter(b_keys, dtype=np.int64, count=len(b_keys))
+    is_a_arr = np.fromiter(choice_is_a, dtype=bool, count=len(choice_is_a))
+    
+    # 승자는 선택지에서 바로 결정, 비교 횟수는 A/B 양쪽 모델에 1씩
+    winner_arr = np.where(is_a_arr, a_arr, b_arr)
+    q_offset = q_arr * n_models
+    wins_keys = q_offset + winner_arr
+    total_keys = np.concatenate([q_offset + a_arr, q_offset + b_arr])
+    wins = np.bincount(wins_keys, minlength=n_questions * n_models).reshape(n_questions, n_models)
+    totals = np.bincount(total_keys, minlength=n_questions * n_models).reshape(n_questions, n_models)
+    
+    if invalid_choices:
+        print(f"⚠️ A/B가 아닌 응답 {invalid_choices}개는 집계에서 제외했습니다.")
+    print(f"📈 분석 완료: {total_participants}명의 참가자 데이터")
+    
+    # wins/totals: (질문, 모델) 배열, 행 순서는 question_names, 열 순서는 models
+    models = list(model_index)
+    return wins, totals, models, question_names, total_participants
+
+def compute_win_rate_matrix(wins, totals):
+    """(질문, 모델) 승률 행렬 계산 - 비교가 없는 칸은 0"""
+    return np.divide(wins, totals, out=np.zeros(wins.shape), where=totals > 0)
+
+def present_model_indices(totals, qi=None):
+    """비교 기록이 있는 모델 인덱스 (qi 지정 시 해당 질문 기준)"""
+    present = totals[qi] > 0 if qi is not None else totals.sum(axis=0) > 0
+    return np.flatnonzero(present)
+
+def _imshow_heatmap(ax, data, xticklabels, yticklabels, cmap, vmin, vmax,
+                    annot=True, fmt='.1f', cbar_label=None):
+    """imshow 기반 히트맵 (셀마다 사각형을 만드는 sns.heatmap 대신 이미지 하나로 렌더링)"""
+    im = ax.imshow(data, cmap=cmap, vmin=vmin, vmax=vmax,
+                   interpolation='none', aspect='auto')
+    cbar = ax.figure.colorbar(im, ax=ax)
+    if cbar_label:
+        cbar.set_label(cbar_label)
+    
+    ax.set_xticks(range(len(xticklabels)))
+    ax.set_xticklabels(xticklabels)
+    ax.set_yticks(range(len(yticklabels)))
+    ax.set_yticklabels(yticklabels)
+    
+    if annot:
+        # 셀 밝기에 따라 글자색 선택
+        for i in range(data.shape[0]):
+            for j in range(data.shape[1]):
+                r, g, b, _ = im.cmap(im.norm(data[i, j]))
+                color = 'black' if 0.299 * r + 0.587 * g + 0.114 * b > 0.5 else 'white'
+                ax.text(j, i, format(data[i, j], fmt), ha='center', va='center', color=color)
+    
+    return im
+
+def create_win_rate_chart(ax, rates, wins, totals, models, question_names):
     """승률 차트 생성"""
-    models = ['matrix', 'cogvideox_5b', 'opensora', 'tavid', 'wan14b']
-    questions = list(question_names.keys())
-    
-    # 데이터 준비
-    win_rates = []
-    for model in models:
-        model_rates = []
-        for question in questions:
-            if model_total[question][model] > 0:
-                rate = model_wins[question][model] / model_total[question][model]
-            else:
-                rate = 0
-            model_rates.append(rate * 100)  # 퍼센트로 변환
-        win_rates.append(model_rates)
+    # MODELS는 항상 models의 앞부분에 같은 순서로 위치
+    win_rates = rates[:, :len(MODELS)].T * 100  # 퍼센트로 변환
     
     # 히트맵 생성
-    plt.figure(figsize=(12, 8))
     win_rates_df = pd.DataFrame(win_rates, 
-                               index=models, 
-                               columns=[question_names[q] for q in questions])
+                               index=MODELS, 
+                               columns=list(question_names.values()))
     
-    sns.heatmap(win_rates_df, annot=True, fmt='.1f', cmap='RdYlBu_r', 
-                cbar_kws={'label': '승률 (%)'}, vmin=0, vmax=100)
+    _imshow_heatmap(ax, win_rates, list(win_rates_df.columns), MODELS,
+                    cmap='RdYlBu_r', vmin=0, vmax=100, cbar_label='승률 (%)')
     
-    plt.title('모델별 평가 항목 승률 (User Study Results)', fontsize=16, pad=20)
-    plt.xlabel('평가 항목', fontsize=12)
-    plt.ylabel('모델', fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.yticks(rotation=0)
-    plt.tight_layout()
+    ax.set_title('모델별 평가 항목 승률 (User Study Results)', fontsize=16, pad=20)
+    ax.set_xlabel('평가 항목', fontsize=12)
+    ax.set_ylabel('모델', fontsize=12)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    plt.setp(ax.get_yticklabels(), rotation=0)
+    ax.figure.tight_layout()
     
-    return plt.gcf(), win_rates_df
+    return win_rates_df
 
-def create_overall_ranking_chart(model_wins, model_total):
+def create_overall_ranking_chart(ax, rates, wins, totals, models, question_names):
     """전반적 품질 기준 순위 차트"""
-    question = 'overall_quality'
-    models_data = []
+    qi = list(question_names).index('overall_quality')
+    present = present_model_indices(totals, qi)
     
-    for model in model_total[question]:
-        if model_total[question][model] > 0:
-            win_rate = model_wins[question][model] / model_total[question][model]
-            total_comparisons = model_total[question][model]
-            wins = model_wins[question][model]
-            models_data.append([model, win_rate * 100, wins, total_comparisons])
-    
-    if not models_data:
+    if len(present) == 0:
         # 데이터가 없으면 빈 차트 반환
-        plt.figure(figsize=(10, 6))
-        plt.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=plt.gca().transAxes)
-        plt.title('전반적 품질 기준 모델 순위 - 데이터 없음')
-        return plt.gcf(), pd.DataFrame()
-    
-    # 승률로 정렬
-    models_data.sort(key=lambda x: x[1])  # 승률로 정렬
+        ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
+        ax.set_title('전반적 품질 기준 모델 순위 - 데이터 없음')
+        return pd.DataFrame()
     
-    models = [data[0] for data in models_data]
-    win_rates = [data[1] for data in models_data]
-    wins = [data[2] for data in models_data]
-    totals = [data[3] for data in models_data]
+    # 승률 오름차순 정렬 (barh는 아래에서부터 그리므로 1위가 맨 위)
+    order = present[np.argsort(rates[qi, present], kind='stable')]
+    ranked_models = [models[mi] for mi in order]
+    win_rates = rates[qi, order] * 100
+    ranked_wins = wins[qi, order]
+    ranked_totals = totals[qi, order]
     
-    plt.figure(figsize=(10, 6))
-    bars = plt.barh(models, win_rates, 
-                    color=['#ff7f0e', '#2ca02c', '#d62728', '#1f77b4', '#9467bd'][:len(models)])
+    bars = ax.barh(ranked_models, win_rates, 
+                    color=['#ff7f0e', '#2ca02c', '#d62728', '#1f77b4', '#9467bd'][:len(ranked_models)])
     
     # 바 위에 숫자 표시
     for i, bar in enumerate(bars):
-        plt.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2, 
-                f"{win_rates[i]:.1f}% ({wins[i]}/{totals[i]})",
+        ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2, 
+                f"{win_rates[i]:.1f}% ({ranked_wins[i]}/{ranked_totals[i]})",
                 va='center', fontsize=10)
     
-    plt.title('전반적 품질 기준 모델 순위', fontsize=16, pad=20)
-    plt.xlabel('승률 (%)', fontsize=12)
-    plt.ylabel('모델', fontsize=12)
-    plt.xlim(0, max(win_rates) * 1.2 if win_rates else 100)
-    plt.grid(axis='x', alpha=0.3)
-    plt.tight_layout()
+    ax.set_title('전반적 품질 기준 모델 순위', fontsize=16, pad=20)
+    ax.set_xlabel('승률 (%)', fontsize=12)
+    ax.set_ylabel('모델', fontsize=12)
+    ax.set_xlim(0, win_rates.max() * 1.2)
+    ax.grid(axis='x', alpha=0.3)
+    ax.figure.tight_layout()
     
     # DataFrame 생성 (CSV 저장용)
     models_df = pd.DataFrame({
-        'Model': models,
+        'Model': ranked_models,
         'WinRate': win_rates,
-        'Wins': wins,
-        'Total': totals
+        'Wins': ranked_wins,
+        'Total': ranked_totals
     })
     
-    return plt.gcf(), models_df
+    return models_df
 
-def create_comparison_matrix(model_wins, model_total):
+def create_comparison_matrix(ax, rates, wins, totals, models, question_names):
     """모델 간 직접 비교 매트릭스"""
-    models = ['matrix', 'cogvideox_5b', 'opensora', 'tavid', 'wan14b']
-    comparison_data = np.zeros((len(models), len(models)))
+    n = len(MODELS)
     
     # 모델 간 승률 계산 (전반적 품질 기준)
-    question = 'overall_quality'
-    
-    for i, model1 in enumerate(models):
-        for j, model2 in enumerate(models):
-            if i == j:
-                comparison_data[i][j] = 50  # 자기 자신과는 50%
-            elif model_total[question][model1] > 0 and model_total[question][model2] > 0:
-                # 간접적 비교 (승률 차이 기준)
-                rate1 = model_wins[question][model1] / model_total[question][model1]
-                rate2 = model_wins[question][model2] / model_total[question][model2]
-                if rate1 + rate2 > 0:
-                    comparison_data[i][j] = (rate1 / (rate1 + rate2)) * 100
-                else:
-                    comparison_data[i][j] = 50
-            else:
-                comparison_data[i][j] = 50
-    
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(comparison_data, annot=True, fmt='.1f', 
-                xticklabels=models, yticklabels=models,
-                cmap='RdYlBu_r', vmin=0, vmax=100,
-                cbar_kws={'label': '상대 승률 (%)'})
-    
-    plt.title('모델 간 상대적 성능 비교 매트릭스', fontsize=16, pad=20)
-    plt.xlabel('상대방 모델', fontsize=12)
-    plt.ylabel('기준 모델', fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.yticks(rotation=0)
-    plt.tight_layout()
-    
-    return plt.gcf()
-
-def create_detailed_stats_chart(model_wins, model_total, question_names):
-    """상세 통계 차트"""
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    qi = list(question_names).index('overall_quality')
+    rate = rates[qi, :n]
+    has_data = totals[qi, :n] > 0
+    
+    # 간접적 비교 (승률 차이 기준): rate1 / (rate1 + rate2), 비교 불가하거나 자기 자신이면 50%
+    rate_sum = rate[:, None] + rate[None, :]
+    valid = has_data[:, None] & has_data[None, :] & (rate_sum > 0)
+    comparison_data = np.full((n, n), 50.0)
+    np.divide(rate[:, None] * 100, rate_sum, out=comparison_data, where=valid)
+    np.fill_diagonal(comparison_data, 50)
+    
+    _imshow_heatmap(ax, comparison_data, MODELS, MODELS,
+                    cmap='RdYlBu_r', vmin=0, vmax=100, cbar_label='상대 승률 (%)')
+    
+    ax.set_title('모델 간 상대적 성능 비교 매트릭스', fontsize=16, pad=20)
+    ax.set_xlabel('상대방 모델', fontsize=12)
+    ax.set_ylabel('기준 모델', fontsize=12)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    plt.setp(ax.get_yticklabels(), rotation=0)
+    ax.figure.tight_layout()
+
+def create_detailed_stats_chart(axes, rates, wins, totals, models, question_names):
+    """상세 통계 차트 (axes: 2x3 서브플롯)"""
+    fig = axes.flat[0].figure
     axes = axes.flatten()
     
     questions = list(question_names.keys())
@@ -270,22 +310,17 @@ def create_detailed_stats_chart(model_wins, model_total, question_names):
     for i, question in enumerate(questions):
         ax = axes[i]
         
-        models_data = []
-        for model in model_total[question]:
-            if model_total[question][model] > 0:
-                win_rate = model_wins[question][model] / model_total[question][model]
-                models_data.append([model, win_rate * 100, model_wins[question][model]])
+        present = present_model_indices(totals, i)
         
-        if models_data:
+        if len(present):
             # 승률로 내림차순 정렬
-            models_data.sort(key=lambda x: x[1], reverse=True)
-            
-            models = [data[0] for data in models_data]
-            win_rates = [data[1] for data in models_data]
-            counts = [data[2] for data in models_data]
+            order = present[np.argsort(-rates[i, present], kind='stable')]
+            model_labels = [models[mi] for mi in order]
+            win_rates = rates[i, order] * 100
+            counts = wins[i, order]
             
-            bars = ax.bar(models, win_rates, 
-                         color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd'][:len(models)])
+            bars = ax.bar(model_labels, win_rates, 
+                         color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd'][:len(model_labels)])
             
             # 바 위에 값 표시
             for j, bar in enumerate(bars):
@@ -296,7 +331,7 @@ def create_detailed_stats_chart(model_wins, model_total, question_names):
             
             ax.set_title(question_names[question], fontsize=14, pad=10)
             ax.set_ylabel('승률 (%)', fontsize=10)
-            max_rate = max(win_rates) if win_rates else 0
+            max_rate = win_rates.max()
             ax.set_ylim(0, max_rate * 1.3 if max_rate > 0 else 100)
             ax.tick_params(axis='x', rotation=45)
             ax.grid(axis='y', alpha=0.3)
@@ -309,51 +344,47 @@ def create_detailed_stats_chart(model_wins, model_total, question_names):
     if len(questions) < len(axes):
         axes[-1].set_visible(False)
     
-    plt.suptitle('평가 항목별 모델 성능 상세 분석', fontsize=16, y=0.95)
-    plt.tight_layout()
-    
-    return fig
-
-def create_radar_chart(model_wins, model_total, question_names):
-    """모델별 5개 평가 지표에 대한 Radar Chart 생성"""
-    # 전체 모델 목록 수집
-    all_models = set()
-    for question_data in model_total.values():
-        all_models.update(question_data.keys())
-    all_models = sorted(list(all_models))
-    
-    # 모델별 승률 계산
-    model_scores = {}
-    for model in all_models:
-        scores = []
-        for question in question_names.keys():
-            if model in model_total[question] and model_total[question][model] > 0:
-                win_rate = model_wins[question][model] / model_total[question][model]
-            else:
-                win_rate = 0
-            scores.append(win_rate)
-        model_scores[model] = scores
-    
-    # 평가 지표 이름 (한국어)
-    categories = [
-        '상호작용\n정확성',
-        '객체 반영\n정확도', 
-        '시간적\n일관성',
-        '의미적\n정렬',
-        '전반적\n품질'
-    ]
+    fig.suptitle('평가 항목별 모델 성능 상세 분석', fontsize=16, y=0.95)
+    fig.tight_layout()
+
+# 평가 지표 이름 (한국어, Radar Chart 축 라벨)
+RADAR_CATEGORIES = [
+    '상호작용\n정확성',
+    '객체 반영\n정확도',
+    '시간적\n일관성',
+    '의미적\n정렬',
+    '전반적\n품질'
+]
+
+def prepare_radar_data(rates, totals, models):
+    """두 Radar Chart가 공유하는 데이터 준비
+    
+    Returns:
+        (비교 기록이 있는 모델 이름순 리스트, 닫힌 폴리곤용 점수 행렬 (모델 x 지표+1),
+         닫힌 폴리곤용 각도, 지표 이름)
+    """
+    model_indices = sorted(present_model_indices(totals), key=lambda mi: models[mi])
+    radar_models = [models[mi] for mi in model_indices]
+    
+    # 모델별 승률 (질문 순서) - 첫 열을 끝에 붙여 폴리곤을 한 번에 닫음
+    scores = rates[:, model_indices].T
+    scores_closed = np.concatenate([scores, scores[:, :1]], axis=1)
     
-    # 각도 계산
-    N = len(categories)
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]  # 닫힌 폴리곤을 위해
+    N = len(RADAR_CATEGORIES)
+    angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    angles_closed = np.concatenate([angles, angles[:1]])
+    
+    return radar_models, scores_closed, angles_closed, RADAR_CATEGORIES
+
+def create_radar_chart(axes, rates, wins, totals, models, question_names):
+    """모델별 5개 평가 지표에 대한 Radar Chart 생성 (axes: 2x3 polar 서브플롯)"""
+    all_models, scores_closed, angles, categories = prepare_radar_data(rates, totals, models)
     
     # 컬러 팔레트
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', 
               '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43']
     
-    # 서브플롯 생성 (2x3 그리드)
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12), subplot_kw=dict(projection='polar'))
+    fig = axes.flat[0].figure
     fig.suptitle('🎯 모델별 평가 지표 Radar Chart', fontsize=20, fontweight='bold', y=0.98)
     
     # 축을 1차원으로 평탄화
@@ -365,13 +396,13 @@ def create_radar_chart(model_wins, model_total, question_names):
             break
             
         ax = axes_flat[idx]
-        scores = model_scores[model]
-        scores += scores[:1]  # 닫힌 폴리곤을 위해
+        scores = scores_closed[idx]
         
         # Radar chart 그리기
         color = colors[idx % len(colors)]
         ax.plot(angles, scores, 'o-', linewidth=2, label=model, color=color)
-        ax.fill(angles, scores, alpha=0.25, color=color)
+        for polygon in ax.fill(angles, scores, alpha=0.25, color=color):
+            polygon.set_rasterized(True)
         
         # 축 설정
         ax.set_xticks(angles[:-1])
@@ -393,58 +424,27 @@ def create_radar_chart(model_wins, model_total, question_names):
     for idx in range(len(all_models), len(axes_flat)):
         axes_flat[idx].set_visible(False)
     
-    plt.tight_layout()
-    return fig
-
-def create_combined_radar_chart(model_wins, model_total, question_names):
-    """모든 모델을 한 Radar Chart에 표시"""
-    # 전체 모델 목록 수집
-    all_models = set()
-    for question_data in model_total.values():
-        all_models.update(question_data.keys())
-    all_models = sorted(list(all_models))
-    
-    # 모델별 승률 계산
-    model_scores = {}
-    for model in all_models:
-        scores = []
-        for question in question_names.keys():
-            if model in model_total[question] and model_total[question][model] > 0:
-                win_rate = model_wins[question][model] / model_total[question][model]
-            else:
-                win_rate = 0
-            scores.append(win_rate)
-        model_scores[model] = scores
-    
-    # 평가 지표 이름 (한국어)
-    categories = [
-        '상호작용 정확성',
-        '객체 반영 정확도', 
-        '시간적 일관성',
-        '의미적 정렬',
-        '전반적 품질'
-    ]
-    
-    # 각도 계산
-    N = len(categories)
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]  # 닫힌 폴리곤을 위해
+    fig.tight_layout()
+
+def create_combined_radar_chart(ax, rates, wins, totals, models, question_names):
+    """모든 모델을 한 Radar Chart에 표시 (ax: polar 축)"""
+    all_models, scores_closed, angles, categories = prepare_radar_data(rates, totals, models)
+    categories = [category.replace('\n', ' ') for category in categories]
     
     # 컬러 팔레트
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57']
     
-    # Figure 생성
-    fig, ax = plt.subplots(figsize=(12, 10), subplot_kw=dict(projection='polar'))
+    fig = ax.figure
     fig.suptitle('🎯 모든 모델 비교 Radar Chart', fontsize=18, fontweight='bold', y=0.95)
     
     # 각 모델별로 radar chart 그리기
     for idx, model in enumerate(all_models):
-        scores = model_scores[model]
-        scores += scores[:1]  # 닫힌 폴리곤을 위해
+        scores = scores_closed[idx]
         
         color = colors[idx % len(colors)]
         ax.plot(angles, scores, 'o-', linewidth=2, label=model, color=color, markersize=6)
-        ax.fill(angles, scores, alpha=0.15, color=color)
+        for polygon in ax.fill(angles, scores, alpha=0.15, color=color):
+            polygon.set_rasterized(True)
     
     # 축 설정
     ax.set_xticks(angles[:-1])
@@ -457,24 +457,59 @@ def create_combined_radar_chart(model_wins, model_total, question_names):
     # 범례 설정
     ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=12)
     
-    plt.tight_layout()
-    return fig
+    fig.tight_layout()
+
+# 차트 이름 → (그리기 함수, figsize, 서브플롯 행, 열, polar 여부, 출력 파일)
+CHART_SPECS = {
+    'win_rates': (create_win_rate_chart, (12, 8), 1, 1, False, 'win_rates_heatmap.png'),
+    'ranking': (create_overall_ranking_chart, (10, 6), 1, 1, False, 'overall_ranking.png'),
+    'comparison': (create_comparison_matrix, (10, 8), 1, 1, False, 'comparison_matrix.png'),
+    'detailed_stats': (create_detailed_stats_chart, (18, 12), 2, 3, False, 'detailed_stats.png'),
+    'radar': (create_radar_chart, (18, 12), 2, 3, True, 'individual_radar_charts.png'),
+    'combined_radar': (create_combined_radar_chart, (12, 10), 1, 1, True, 'combined_radar_chart.png'),
+}
+
+# PNG 저장 해상도
+SAVE_DPI = 150
+
+# 범례가 축 밖에 그려져 bbox_inches='tight'가 필요한 차트
+OUTSIDE_LEGEND_CHARTS = {'combined_radar'}
+
+def _render_and_save(name, rates, wins, totals, models, question_names, output_dir):
+    """차트 하나를 그려 PNG로 저장하고 (이름, DataFrame 또는 None) 반환"""
+    _lazy_imports()
+    create_chart, figsize, nrows, ncols, polar, output_file = CHART_SPECS[name]
+    subplot_kw = dict(projection='polar') if polar else None
+    fig, ax = plt.subplots(nrows, ncols, figsize=figsize, subplot_kw=subplot_kw)
+    
+    df = create_chart(ax, rates, wins, totals, models, question_names)
+    # 차트 함수가 tight_layout을 이미 적용하므로 bbox 측정용 추가 렌더링은 생략
+    # (범례가 축 밖에 있는 차트만 예외)
+    bbox_inches = 'tight' if name in OUTSIDE_LEGEND_CHARTS else None
+    fig.savefig(f"{output_dir}/{output_file}", dpi=SAVE_DPI, bbox_inches=bbox_inches,
+                pil_kwargs={'compress_level': 1})
+    plt.close(fig)
+    return name, df
 
 def save_visualizations(filename_prefix):
     """모든 시각화 저장"""
     try:
         # 결과 로드
-        results, filename = load_latest_results()
+        participants, filename = load_latest_results()
         order_sheets = load_order_sheets()
         
         print(f"📊 Order sheets 로드됨: {len(order_sheets)}개")
         
         # 분석 수행
-        model_wins, model_total, question_names = analyze_results(results, order_sheets)
+        wins, totals, models, question_names, participant_count = analyze_results(participants, order_sheets)
+        
+        # 모든 차트가 공유하는 승률 행렬
+        rates = compute_win_rate_matrix(wins, totals)
         
         # 날짜별 출력 디렉토리 생성
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        timestamp = datetime.now().strftime("%H%M%S")
+        now = datetime.now()
+        current_date = now.strftime("%Y-%m-%d")
+        timestamp = now.strftime("%H%M%S")
         
         base_output_dir = "visualization_output"
         date_output_dir = os.path.join(base_output_dir, current_date)
@@ -483,55 +518,34 @@ def save_visualizations(filename_prefix):
         os.makedirs(output_dir, exist_ok=True)
         
         print(f"📁 출력 디렉토리: {output_dir}")
-        print(f"📊 분석 중: {len(results)}명의 참가자 데이터")
-        
-        # 1. 히트맵 (승률)
-        print("📈 히트맵 생성 중...")
-        fig1, win_rates_df = create_win_rate_chart(model_wins, model_total, question_names)
-        fig1.savefig(f"{output_dir}/win_rates_heatmap.png", dpi=300, bbox_inches='tight')
-        win_rates_df.to_csv(f"{output_dir}/win_rates_data.csv")
-        plt.close(fig1)
-        
-        # 2. 전반적 순위
-        print("🏆 순위 차트 생성 중...")
-        fig2, ranking_df = create_overall_ranking_chart(model_wins, model_total)
-        fig2.savefig(f"{output_dir}/overall_ranking.png", dpi=300, bbox_inches='tight')
-        ranking_df.to_csv(f"{output_dir}/ranking_data.csv")
-        plt.close(fig2)
-        
-        # 3. 비교 매트릭스
-        print("🔄 비교 매트릭스 생성 중...")
-        fig3 = create_comparison_matrix(model_wins, model_total)
-        fig3.savefig(f"{output_dir}/comparison_matrix.png", dpi=300, bbox_inches='tight')
-        plt.close(fig3)
-        
-        # 4. 상세 통계
-        print("📊 상세 통계 생성 중...")
-        fig4 = create_detailed_stats_chart(model_wins, model_total, question_names)
-        fig4.savefig(f"{output_dir}/detailed_stats.png", dpi=300, bbox_inches='tight')
-        plt.close(fig4)
-        
-        # 5. 개별 모델 Radar Charts
-        print("🎯 개별 모델 Radar Chart 생성 중...")
-        fig5 = create_radar_chart(model_wins, model_total, question_names)
-        fig5.savefig(f"{output_dir}/individual_radar_charts.png", dpi=300, bbox_inches='tight')
-        plt.close(fig5)
-        
-        # 6. 통합 Radar Chart
-        print("🎯 통합 Radar Chart 생성 중...")
-        fig6 = create_combined_radar_chart(model_wins, model_total, question_names)
-        fig6.savefig(f"{output_dir}/combined_radar_chart.png", dpi=300, bbox_inches='tight')
-        plt.close(fig6)
+        print(f"📊 분석 중: {participant_count}명의 참가자 데이터")
+        
+        # 6개 차트는 서로 독립적이므로 프로세스 풀에서 병렬로 렌더링
+        print("📈 차트 생성 중 (병렬)...")
+        with ProcessPoolExecutor(max_workers=len(CHART_SPECS),
+                                 initializer=_lazy_imports) as executor:
+            futures = [executor.submit(_render_and_save, name, rates, wins, totals,
+                                       models, question_names, output_dir)
+                       for name in CHART_SPECS]
+            chart_data = {}
+            for future in as_completed(futures):
+                name, df = future.result()
+                chart_data[name] = df
+                print(f"   ✓ {CHART_SPECS[name][-1]}")
+        
+        # 승률 표는 인덱스(모델 이름)를 유지, 순위 표는 의미 없는 행 번호 인덱스 제외
+        chart_data['win_rates'].to_csv(f"{output_dir}/win_rates_data.csv", float_format='%.1f')
+        chart_data['ranking'].to_csv(f"{output_dir}/ranking_data.csv", index=False)
         
         # 요약 리포트 생성
         print("📄 요약 리포트 생성 중...")
-        create_summary_report(model_wins, model_total, question_names, 
+        create_summary_report(rates, wins, totals, models, question_names, 
                             f"{output_dir}/summary_report.txt", 
-                            filename, len(results))
+                            filename, participant_count, now)
         
         # 분석 메타데이터 생성
         print("📋 분석 메타데이터 생성 중...")
-        create_analysis_metadata(output_dir, filename, len(results), timestamp)
+        create_analysis_metadata(output_dir, filename, participant_count, now)
         
         print(f"\n✅ 모든 시각화 완료!")
         print(f"📁 출력 디렉토리: {output_dir}/")
@@ -544,8 +558,8 @@ def save_visualizations(filename_prefix):
         print(f"❌ 에러 발생: {e}")
         raise
 
-def create_summary_report(model_wins, model_total, question_names, output_file, data_file, participant_count):
-    """요약 리포트 생성"""
+def create_summary_report(rates, wins, totals, models, question_names, output_file, data_file, participant_count, now):
+    """요약 리포트 생성 (now: 분석 시작 시각)"""
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write("=" * 60 + "\n")
         f.write("사용자 연구 결과 요약 리포트\n")
@@ -553,23 +567,20 @@ def create_summary_report(model_wins, model_total, question_names, output_file,
         
         f.write(f"데이터 파일: {data_file}\n")
         f.write(f"참가자 수: {participant_count}명\n")
-        f.write(f"생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"생성 시각: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         
         # 전반적 품질 순위
         f.write("🏆 전반적 품질 순위\n")
         f.write("-" * 30 + "\n")
         
-        question = 'overall_quality'
-        models_data = []
-        for model in model_total[question]:
-            if model_total[question][model] > 0:
-                win_rate = model_wins[question][model] / model_total[question][model]
-                models_data.append((model, win_rate * 100, model_wins[question][model], model_total[question][model]))
+        qi = list(question_names).index('overall_quality')
+        models_data = [(models[mi], rates[qi, mi] * 100, int(wins[qi, mi]), int(totals[qi, mi]))
+                       for mi in present_model_indices(totals, qi)]
         
         models_data.sort(key=lambda x: x[1], reverse=True)
         
-        for i, (model, rate, wins, total) in enumerate(models_data, 1):
-            f.write(f"{i}. {model}: {rate:.1f}% ({wins}/{total})\n")
+        for i, (model, rate, model_wins, total) in enumerate(models_data, 1):
+            f.write(f"{i}. {model}: {rate:.1f}% ({model_wins}/{total})\n")
         
         f.write("\n")
         
@@ -577,16 +588,16 @@ def create_summary_report(model_wins, model_total, question_names, output_file,
         f.write("📊 평가 항목별 최고 성능 모델\n")
         f.write("-" * 40 + "\n")
         
-        for question, korean_name in question_names.items():
+        for qi, korean_name in enumerate(question_names.values()):
             best_model = None
             best_rate = 0
             
-            for model in model_total[question]:
-                if model_total[question][model] > 0:
-                    rate = model_wins[question][model] / model_total[question][model]
-                    if rate > best_rate:
-                        best_rate = rate
-                        best_model = model
+            present = present_model_indices(totals, qi)
+            if len(present) > 0:
+                best_mi = present[np.argmax(rates[qi, present])]
+                if rates[qi, best_mi] > 0:
+                    best_rate = rates[qi, best_mi]
+                    best_model = models[best_mi]
             
             if best_model:
                 f.write(f"{korean_name}: {best_model} ({best_rate*100:.1f}%)\n")
@@ -597,27 +608,28 @@ def create_summary_report(model_wins, model_total, question_names, output_file,
         f.write("📈 상세 통계\n")
         f.write("-" * 20 + "\n")
         
-        for question, korean_name in question_names.items():
+        for qi, korean_name in enumerate(question_names.values()):
             f.write(f"\n{korean_name}:\n")
-            models_data = []
-            for model in model_total[question]:
-                if model_total[question][model] > 0:
-                    win_rate = model_wins[question][model] / model_total[question][model]
-                    models_data.append((model, win_rate * 100, model_wins[question][model], model_total[question][model]))
+            models_data = [(models[mi], rates[qi, mi] * 100, int(wins[qi, mi]), int(totals[qi, mi]))
+                           for mi in present_model_indices(totals, qi)]
             
             models_data.sort(key=lambda x: x[1], reverse=True)
             
-            for model, rate, wins, total in models_data:
-                f.write(f"  {model}: {rate:.1f}% ({wins}/{total})\n")
+            for model, rate, model_wins, total in models_data:
+                f.write(f"  {model}: {rate:.1f}% ({model_wins}/{total})\n")
 
-def create_analysis_metadata(output_dir, source_filename, participant_count, timestamp):
-    """분석 메타데이터 파일 생성"""
+def create_analysis_metadata(output_dir, source_filename, participant_count, now):
+    """분석 메타데이터 파일 생성 (now: 분석 시작 시각, 모든 날짜/시간 문자열의 기준)"""
+    iso_date = now.strftime('%Y-%m-%d')
+    iso_full = now.strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = now.strftime('%H%M%S')
+    
     metadata_file = os.path.join(output_dir, "analysis_metadata.json")
     
     metadata = {
         "analysis_info": {
-            "timestamp": f"{datetime.now().strftime('%Y-%m-%d')} {timestamp}",
-            "date": datetime.now().strftime('%Y-%m-%d'),
+            "timestamp": f"{iso_date} {timestamp}",
+            "date": iso_date,
             "time": timestamp,
             "source_file": source_filename,
             "participant_count": participant_count,
@@ -644,12 +656,16 @@ def create_analysis_metadata(output_dir, source_filename, participant_count, tim
         "folder_structure": {
             "description": "날짜별 폴더 구조로 분석 결과 저장",
             "pattern": "visualization_output/YYYY-MM-DD/analysis_HHMMSS/",
-            "example": f"visualization_output/{datetime.now().strftime('%Y-%m-%d')}/analysis_{timestamp}/"
+            "example": f"visualization_output/{iso_date}/analysis_{timestamp}/"
         }
     }
     
-    with open(metadata_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(metadata_file, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(metadata_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
     
     # README 파일도 생성
     readme_file = os.path.join(output_dir, "README.md")
@@ -657,7 +673,7 @@ def create_analysis_metadata(output_dir, source_filename, participant_count, tim
         f.write(f"""# 🎨 사용자 연구 시각화 결과
 
 ## 📊 분석 정보
-- **분석 일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- **분석 일시**: {iso_full}
 - **데이터 소스**: {source_filename}
 - **참가자 수**: {participant_count}명
 - **분석 타임스탬프**: {timestamp}
@@ -684,7 +700,7 @@ def create_analysis_metadata(output_dir, source_filename, participant_count, tim
 ## 🗂️ 폴더 구조
 ```
 visualization_output/
-└── {datetime.now().strftime('%Y-%m-%d')}/
+└── {iso_date}/
     └── analysis_{timestamp}/
         ├── 시각화 파일들 (.png)
         ├── 데이터 파일들 (.csv)
@@ -693,7 +709,7 @@ visualization_output/
 ```
 
 ---
-*생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*생성일시: {iso_full}*
 """)
 
 if __name__ == "__main__":
@@ -5,9 +5,13 @@ for user study preparation. Uses the matching logic from video_comparison_viewer
 to find videos by their DeepSink (Ours) numbering.
 """
 
+import argparse
+import errno
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 
 # Define all directories (from notebook)
@@ -52,97 +56,268 @@ MODEL_MAPPING = {
 
 # Which models to copy (all models for comparison)
 MODELS_TO_COPY = ["Ours", "LongLive", "Self-Forcing", "RollingForcing", "Causvid"]
+MODELS_TO_COPY_SET = frozenset(MODELS_TO_COPY)
+
+# Number of concurrent file copies
+COPY_WORKERS = 16
+
+# Read/write chunk size when falling back to a userspace copy
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
 
 # Prompts file path
 PROMPTS_FILE = "/data/jung/ForcingForcing/Self-Forcing/prompts/MovieGenVideoBench_extended.txt"
 
 
+# Trailing suffixes stripped from video file names, in one pass. Equivalent to
+# removing "-lora-N", then "-NNN", then "-N" from the end, one after another
+_SUFFIX_RE = re.compile(r'(?:-\d+)?(?:-\d{3})?(?:-lora-\d+)?$')
+
+# Directory scan results: {(base_path, model_name, duration, wanted_numbers, wanted_bases): (file_mapping, ours_number_mapping)}
+_SCAN_CACHE = {}
+
+
 def extract_base_name(filename):
     """Extract base name by removing common suffixes and trailing spaces"""
-    base = filename.replace('.mp4', '')
-    base = re.sub(r'-lora-\d+$', '', base)
-    base = re.sub(r'-\d{3}$', '', base)
-    base = re.sub(r'-\d+$', '', base)
-    return base.rstrip()
+    base = filename[:-4] if filename.endswith('.mp4') else filename
+    return _SUFFIX_RE.sub('', base).rstrip()
+
+
+def _fadvise(fd, advice_name):
+    """posix_fadvise on the whole file where available (Linux); it is only a hint, so errors are ignored"""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def fast_copy(src, dst):
+    """Copy a file with copy_file_range so data stays in the kernel, preserving metadata like shutil.copy2
+    
+    Sources are read once, so they are advised as sequential (bigger readahead) and dropped
+    from the page cache afterwards instead of evicting more useful pages.
+    """
+    # Same guard as shutil.copy2: opening dst for writing would truncate src (e.g. a hardlink)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            _fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Some filesystem/kernel combinations stop early; redo the copy in userspace
+                    raise OSError(errno.EIO, f"copy_file_range stopped with {remaining} bytes left")
+                remaining -= copied
+            _fadvise(src_fd, 'POSIX_FADV_DONTNEED')
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux / old Python), unsupported across these filesystems,
+        # or a short copy
+        # dst stays buffered: BufferedWriter retries partial writes, raw FileIO.write does not
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb') as fdst:
+            _fadvise(fsrc.fileno(), 'POSIX_FADV_SEQUENTIAL')
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+            _fadvise(fsrc.fileno(), 'POSIX_FADV_DONTNEED')
+    shutil.copystat(src, dst)
+
+
+def _replace_with_copy(src, dst):
+    """Copy src to dst; a dst hardlinked to src (from an earlier --link run) is unlinked first
+    so the copy gets its own inode instead of truncating the shared source"""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        os.remove(dst)
+    fast_copy(src, dst)
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst (no data copied); fall back to fast_copy across filesystems"""
+    try:
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            # Re-run: replace the previous output like a copy would
+            os.remove(dst)
+            os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        _replace_with_copy(src, dst)
+
+
+def scan_ours_for_numbers(subdir_path, wanted_numbers=None):
+    """Return [(number, dir_path)] for Ours numbered subdirectories, in numeric order
+    
+    With wanted_numbers, each "<subdir_path>/<number>" is checked directly instead of
+    listing every numbered subdirectory; numbers not found that way (e.g. zero-padded
+    names) fall back to one listing of subdir_path.
+    """
+    numbered_dirs = []
+    missing = set()
+    if wanted_numbers is not None:
+        for video_number in wanted_numbers:
+            dir_path = f"{subdir_path}/{video_number}"
+            if os.path.isdir(dir_path):
+                numbered_dirs.append((video_number, dir_path))
+            else:
+                missing.add(video_number)
+    
+    if wanted_numbers is None or missing:
+        try:
+            with os.scandir(subdir_path) as it:
+                for entry in it:
+                    if not entry.name.isdigit():
+                        continue
+                    video_number = int(entry.name)
+                    if wanted_numbers is not None and video_number not in missing:
+                        continue
+                    if entry.is_dir():
+                        numbered_dirs.append((video_number, entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    
+    # Numeric order so the lowest number wins when two share a base name
+    # (a plain name sort would put "10" before "2")
+    numbered_dirs.sort(key=itemgetter(0))
+    return numbered_dirs
 
 
-def find_video_files_in_subdir(base_path, model_name, duration, duration_subdirs):
-    """Find video files in a specific subdirectory"""
-    actual_subdir = duration_subdirs.get(model_name, {}).get(duration, duration)
-    subdir_path = os.path.join(base_path, actual_subdir)
+def find_video_files_in_subdir(base_path, model_name, duration, duration_subdirs,
+                               wanted_numbers=None, wanted_bases=None):
+    """Find video files in a specific subdirectory (results are cached per process)
+    
+    For Ours, only numbered subdirectories in wanted_numbers are descended into (all if None).
+    For other models, the scan stops once every base name in wanted_bases is found (all if None).
+    """
+    if model_name == "Ours":
+        wanted_numbers = frozenset(wanted_numbers) if wanted_numbers is not None else None
+        wanted_bases = None
+    else:
+        wanted_numbers = None
+        wanted_bases = frozenset(wanted_bases) if wanted_bases is not None else None
+    cache_key = (base_path, model_name, duration, wanted_numbers, wanted_bases)
+    if cache_key in _SCAN_CACHE:
+        return _SCAN_CACHE[cache_key]
+    
+    model_subdirs = duration_subdirs.get(model_name)
+    actual_subdir = model_subdirs.get(duration, duration) if model_subdirs else duration
+    subdir_path = f"{base_path}/{actual_subdir}"
     
     file_mapping = {}  # {base_name: file_path}
-    base_names = set()
     ours_number_mapping = {}  # {base_name: number} for Ours model
     
-    if not os.path.exists(subdir_path):
-        return file_mapping, base_names, ours_number_mapping
-    
-    if os.path.isdir(subdir_path):
+    if model_name == "Ours":
         # For Ours, videos are in numbered subdirectories
-        if model_name == "Ours":
-            for item in sorted(os.listdir(subdir_path)):  # Sort to process in order
-                item_path = os.path.join(subdir_path, item)
-                if os.path.isdir(item_path) and item.isdigit():
-                    video_number = int(item)  # Store the number
-                    for file in os.listdir(item_path):
-                        file_path = os.path.join(item_path, file)
-                        if os.path.isfile(file_path) and file.endswith('.mp4'):
-                            base = extract_base_name(file)
-                            base_names.add(base)
-                            if base not in file_mapping:
-                                file_mapping[base] = file_path
-                                ours_number_mapping[base] = video_number
-        else:
-            # For other models, videos are directly in the subdirectory
-            for file in os.listdir(subdir_path):
-                file_path = os.path.join(subdir_path, file)
-                if os.path.isfile(file_path) and file.endswith('.mp4'):
-                    base = extract_base_name(file)
-                    base_names.add(base)
-                    if base not in file_mapping:
-                        file_mapping[base] = file_path
+        for video_number, dir_path in scan_ours_for_numbers(subdir_path, wanted_numbers):
+            try:
+                files = os.scandir(dir_path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with files:
+                for file_entry in files:
+                    if file_entry.name.endswith('.mp4') and file_entry.is_file():
+                        base = extract_base_name(file_entry.name)
+                        if base not in file_mapping:
+                            file_mapping[base] = file_entry.path
+                            ours_number_mapping[base] = video_number
+    else:
+        # For other models, videos are directly in the subdirectory; iterate lazily so
+        # an early stop also skips the remaining readdir work
+        try:
+            it = os.scandir(subdir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            it = None
+        if it is not None:
+            with it:
+                remaining = set(wanted_bases) if wanted_bases is not None else None
+                for entry in it:
+                    if remaining is not None and not remaining:
+                        break
+                    if entry.name.endswith('.mp4') and entry.is_file():
+                        base = extract_base_name(entry.name)
+                        if remaining is not None:
+                            if base not in remaining:
+                                continue
+                            remaining.discard(base)
+                        if base not in file_mapping:
+                            file_mapping[base] = entry.path
     
-    return file_mapping, base_names, ours_number_mapping
+    _SCAN_CACHE[cache_key] = (file_mapping, ours_number_mapping)
+    return file_mapping, ours_number_mapping
 
 
-def find_video_files(duration, directories_30s, directories_60s, duration_subdirs):
-    """Find all video files for a specific duration"""
+def find_video_files(duration, directories_30s, directories_60s, duration_subdirs, wanted_numbers=None):
+    """Find all video files for a specific duration (Ours limited to wanted_numbers if given)
+    
+    Ours is scanned first; other models then only look for the base names Ours provided.
+    """
     directories = directories_30s if duration == "30s" else directories_60s
     all_file_mapping = {}
-    base_names_by_dir = {}
     ours_number_mapping = {}  # {base_name: number} for sorting
     
-    for name, base_path in directories.items():
-        file_mapping, base_names, ours_numbers = find_video_files_in_subdir(
-            base_path, name, duration, duration_subdirs
+    # Phase 1: Ours decides which base names are needed
+    ours_result = None
+    wanted_bases = None
+    if "Ours" in directories:
+        ours_result = find_video_files_in_subdir(
+            directories["Ours"], "Ours", duration, duration_subdirs, wanted_numbers
         )
+        ours_number_mapping.update(ours_result[1])
+        wanted_bases = set(ours_number_mapping)
+    
+    # Phase 2: other models, stopping once every wanted base name is found
+    for name, base_path in directories.items():
+        if name == "Ours":
+            file_mapping, _ = ours_result
+        else:
+            file_mapping, _ = find_video_files_in_subdir(
+                base_path, name, duration, duration_subdirs, wanted_bases=wanted_bases
+            )
         
         for base_name, file_path in file_mapping.items():
-            if base_name not in all_file_mapping:
-                all_file_mapping[base_name] = {}
-            all_file_mapping[base_name][name] = file_path
-        
-        base_names_by_dir[name] = base_names
-        
-        # Store Ours numbers for sorting
-        if name == "Ours":
-            ours_number_mapping.update(ours_numbers)
+            all_file_mapping.setdefault(base_name, {})[name] = file_path
+    
+    return all_file_mapping, ours_number_mapping
+
+
+def find_video_files_for_all_durations(video_numbers_by_duration, directories_30s, directories_60s,
+                                       duration_subdirs):
+    """Scan every duration up front, concurrently, before any copying starts
     
-    return all_file_mapping, base_names_by_dir, ours_number_mapping
+    Returns {duration: (file_mapping, ours_number_mapping)}.
+    """
+    print(f"Scanning directories for {', '.join(video_numbers_by_duration)} videos...")
+    with ThreadPoolExecutor(max_workers=len(video_numbers_by_duration)) as executor:
+        futures = {
+            duration: executor.submit(find_video_files, duration, directories_30s, directories_60s,
+                                      duration_subdirs, set(video_numbers))
+            for duration, video_numbers in video_numbers_by_duration.items()
+        }
+    return {duration: future.result() for duration, future in futures.items()}
 
 
-def copy_videos_for_duration(duration, video_numbers, directories_30s, directories_60s, duration_subdirs):
-    """Copy videos for a specific duration and list of video numbers"""
+def copy_videos_for_duration(duration, video_numbers, directories_30s, directories_60s, duration_subdirs,
+                             use_links=True, scan_result=None):
+    """Copy videos for a specific duration and list of video numbers
+    
+    With use_links, outputs are hardlinked to the sources when they share a filesystem.
+    scan_result is this duration's entry from find_video_files_for_all_durations (scanned here if None).
+    """
     print(f"\n{'='*80}")
     print(f"Processing {duration} videos")
     print(f"{'='*80}")
     
     # Find all video files
-    print(f"Scanning directories for {duration} videos...")
-    file_mapping, base_names_by_dir, ours_number_mapping = find_video_files(
-        duration, directories_30s, directories_60s, duration_subdirs
-    )
+    if scan_result is None:
+        print(f"Scanning directories for {duration} videos...")
+        scan_result = find_video_files(
+            duration, directories_30s, directories_60s, duration_subdirs, set(video_numbers)
+        )
+    file_mapping, ours_number_mapping = scan_result
     
     # Create reverse mapping: number -> base_name
     number_to_base = {num: base for base, num in ours_number_mapping.items()}
@@ -152,6 +327,14 @@ def copy_videos_for_duration(duration, video_numbers, directories_30s, directori
     # Process each video number
     success_count = 0
     fail_count = 0
+    copy_tasks = []  # (video_num, model_name, source_path, output_path)
+    
+    # Output directories never change, so create each model's once up front
+    # (before the copy threads start, so they don't race on makedirs)
+    output_dirs = {model_name: os.path.join(OUTPUT_BASE, MODEL_MAPPING[model_name])
+                   for model_name in MODELS_TO_COPY}
+    for output_dir in output_dirs.values():
+        os.makedirs(output_dir, exist_ok=True)
     
     for video_num in video_numbers:
         if video_num not in number_to_base:
@@ -162,35 +345,36 @@ def copy_videos_for_duration(duration, video_numbers, directories_30s, directori
         base_name = number_to_base[video_num]
         
         # Check if all required models have this video
-        missing_models = []
-        for model_name in MODELS_TO_COPY:
-            if model_name not in file_mapping.get(base_name, {}):
-                missing_models.append(model_name)
-        
-        if missing_models:
+        model_paths = file_mapping.get(base_name) or {}
+        if not MODELS_TO_COPY_SET.issubset(model_paths):
+            missing_models = [model_name for model_name in MODELS_TO_COPY if model_name not in model_paths]
             print(f"  ✗ Video #{video_num}: Missing models {missing_models}")
             fail_count += 1
             continue
         
-        # Copy videos for each model
+        # Queue copies for each model
         for model_name in MODELS_TO_COPY:
-            source_path = file_mapping[base_name][model_name]
-            output_dir = os.path.join(OUTPUT_BASE, MODEL_MAPPING[model_name])
-            os.makedirs(output_dir, exist_ok=True)
-            
-            output_filename = f"{duration}_{video_num}.mp4"
-            output_path = os.path.join(output_dir, output_filename)
-            
+            source_path = model_paths[model_name]
+            output_path = f"{output_dirs[model_name]}/{duration}_{video_num}.mp4"
+            copy_tasks.append((video_num, model_name, source_path, output_path))
+        
+        success_count += 1
+    
+    # Copies are I/O bound, so run them concurrently; results are reported from the main thread
+    copy_file = _link_or_copy if use_links else _replace_with_copy
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        futures = {
+            executor.submit(copy_file, source_path, output_path): (video_num, model_name, output_path)
+            for video_num, model_name, source_path, output_path in copy_tasks
+        }
+        for future in as_completed(futures):
+            video_num, model_name, output_path = futures[future]
             try:
-                # Copy the file
-                shutil.copy2(source_path, output_path)
-                print(f"  ✓ Video #{video_num} ({model_name}): {output_filename}")
+                future.result()
+                print(f"  ✓ Video #{video_num} ({model_name}): {os.path.basename(output_path)}")
             except Exception as e:
                 print(f"  ✗ Video #{video_num} ({model_name}): Failed to copy - {e}")
                 fail_count += 1
-                continue
-        
-        success_count += 1
     
     print(f"\n{duration} Summary: {success_count} successful, {fail_count} failed")
     return success_count, fail_count
@@ -202,26 +386,34 @@ def extract_prompts(video_numbers_30s, video_numbers_60s, prompts_file, output_f
     print("Extracting Prompts")
     print(f"{'='*80}")
     
-    # Read all prompts
+    # Check prompts file
     if not os.path.exists(prompts_file):
         print(f"✗ Prompts file not found: {prompts_file}")
         return False
     
-    with open(prompts_file, 'r', encoding='utf-8') as f:
-        all_prompts = [line.strip() for line in f.readlines()]
-    
-    print(f"Loaded {len(all_prompts)} prompts from file")
-    
     # Get all unique video numbers
     all_video_numbers = sorted(set(video_numbers_30s + video_numbers_60s))
+    needed = set(all_video_numbers)
+    max_needed = max(needed, default=-1)
+    
+    # Stream the file and keep only the prompts we need, stopping after the last one
+    prompts = {}  # {line index: prompt}
+    with open(prompts_file, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if i > max_needed:
+                break
+            if i in needed:
+                prompts[i] = line.strip()
+    
+    print(f"Loaded {len(prompts)} of {len(needed)} requested prompts from file")
     
     # Extract prompts for our video numbers
     prompts_matched = []
     missing_prompts = []
     
     for video_num in all_video_numbers:
-        if video_num < len(all_prompts):
-            prompt = all_prompts[video_num]
+        if video_num in prompts:
+            prompt = prompts[video_num]
             # Determine which durations this video appears in
             durations = []
             if video_num in video_numbers_30s:
@@ -242,21 +434,32 @@ def extract_prompts(video_numbers_30s, video_numbers_60s, prompts_file, output_f
     
     # Write to output file
     output_path = os.path.join(OUTPUT_BASE, output_file)
+    parts = [
+        "Video Number to Prompt Mapping\n",
+        "=" * 80 + "\n",
+        "Format: Video Number | Durations | Prompt\n",
+        "=" * 80 + "\n\n",
+    ]
+    for item in prompts_matched:
+        durations_str = ", ".join(item['durations'])
+        parts.append(f"Video #{item['number']} | {durations_str} | {item['prompt']}\n\n")
+    
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("Video Number to Prompt Mapping\n")
-        f.write("=" * 80 + "\n")
-        f.write("Format: Video Number | Durations | Prompt\n")
-        f.write("=" * 80 + "\n\n")
-        
-        for item in prompts_matched:
-            durations_str = ", ".join(item['durations'])
-            f.write(f"Video #{item['number']} | {durations_str} | {item['prompt']}\n\n")
+        f.write(''.join(parts))
     
     print(f"✓ Saved {len(prompts_matched)} prompts to: {output_path}")
     return True
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Prepare raw videos for the user study")
+    link_group = parser.add_mutually_exclusive_group()
+    link_group.add_argument('--link', dest='use_links', action='store_true', default=True,
+                            help='Hardlink videos when source and output share a filesystem (default)')
+    link_group.add_argument('--copy', dest='use_links', action='store_false',
+                            help='Always copy video data (use if outputs may be modified in place)')
+    args = parser.parse_args()
+    
     print("="*80)
     print("Prepare Raw Videos for User Study")
     print("="*80)
@@ -264,14 +467,22 @@ def main():
     # Create output base directory
     os.makedirs(OUTPUT_BASE, exist_ok=True)
     
+    # Scan both durations in one concurrent pass
+    scans = find_video_files_for_all_durations(
+        {"30s": VIDEO_NUMBERS_30S, "60s": VIDEO_NUMBERS_60S},
+        directories_30s, directories_60s, duration_subdirs
+    )
+    
     # Process 30s videos
     success_30s, fail_30s = copy_videos_for_duration(
-        "30s", VIDEO_NUMBERS_30S, directories_30s, directories_60s, duration_subdirs
+        "30s", VIDEO_NUMBERS_30S, directories_30s, directories_60s, duration_subdirs, args.use_links,
+        scans["30s"]
     )
     
     # Process 60s videos
     success_60s, fail_60s = copy_videos_for_duration(
-        "60s", VIDEO_NUMBERS_60S, directories_30s, directories_60s, duration_subdirs
+        "60s", VIDEO_NUMBERS_60S, directories_30s, directories_60s, duration_subdirs, args.use_links,
+        scans["60s"]
     )
     
     # Extract prompts